@@ -14,19 +14,24 @@ Run:
 from __future__ import annotations
 
 import json
+import math
 import os
+import queue
 import re
-import shutil
-import subprocess
 import sys
+import threading
+import time
 import uuid
-from dataclasses import asdict, dataclass
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
-from PySide6.QtCore import QObject, QSize, Qt, QThread, QTimer, QUrl, Signal
-from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtCore import QModelIndex, QObject, QRect, QRunnable, QSize, Qt, QThread, QThreadPool, QTimer, QUrl, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -52,29 +57,84 @@ try:
 except Exception:
     yt_dlp = None
 
-try:
-    from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
-except Exception:
-    QAudioOutput = None
-    QMediaPlayer = None
+QAudioOutput = None
+QMediaPlayer = None
+_qt_multimedia_loaded = False
+
+
+def load_qt_multimedia() -> bool:
+    global QAudioOutput, QMediaPlayer, _qt_multimedia_loaded
+    if not _qt_multimedia_loaded:
+        _qt_multimedia_loaded = True
+        try:
+            from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+        except Exception:
+            QAudioOutput = None
+            QMediaPlayer = None
+    return QAudioOutput is not None and QMediaPlayer is not None
 
 
 VIDEO_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+YOUTUBE_URL_PATTERN = re.compile(
+    r"^https?://(?:"
+    r"(?:www\.)?youtu\.be/|(?:www\.|m\.|music\.)?youtube\.com/(?:shorts|embed|live)/"
+    r")([A-Za-z0-9_-]{11})(?=$|[/?#])"
+    r"|^https?://(?:www\.|m\.|music\.)?youtube\.com/watch\?(?:(?!v=)[^&#]*&)*v=([A-Za-z0-9_-]{11})(?=$|[&#])"
+)
 PARTIAL_CACHE_SUFFIXES = (".part", ".ytdl", ".tmp", ".temp")
 EXE_BASE_NAME = "TimerDashboard"
+YDL_INFO_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "noplaylist": True,
+    "skip_download": True,
+}
+
+# Idle YoutubeDL instances per options key; each is lent to one job at a time.
+_ydl_idle: dict[tuple[Any, ...], list[Any]] = {}
+_ydl_lock = threading.Lock()
+_ydl_closed = False
+
+
+@contextmanager
+def borrowed_youtube_dl(key: tuple[Any, ...], opts: dict[str, Any]) -> Iterator[Any]:
+    with _ydl_lock:
+        idle = _ydl_idle.get(key)
+        ydl = idle.pop() if idle else None
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(opts)
 
+    try:
+        yield ydl
+    finally:
+        with _ydl_lock:
+            keep = not _ydl_closed
+            if keep:
+                _ydl_idle.setdefault(key, []).append(ydl)
+        if not keep:
+            ydl.close()
+
+
+def close_youtube_dl_instances() -> None:
+    global _ydl_closed
+    with _ydl_lock:
+        _ydl_closed = True
+        instances = [ydl for idle in _ydl_idle.values() for ydl in idle]
+        _ydl_idle.clear()
+    for ydl in instances:
+        try:
+            ydl.close()
+        except Exception:
+            pass
 
-def format_hms(total_seconds: int) -> str:
-    total_seconds = max(0, int(total_seconds))
+
+def _compute_hms(total_seconds: int) -> str:
     hours, rem = divmod(total_seconds, 3600)
     minutes, seconds = divmod(rem, 60)
     return f"{hours:02}:{minutes:02}:{seconds:02}"
 
 
-def format_duration_short(seconds: int | None) -> str:
-    if not seconds:
-        return "00:00"
-    total = int(seconds)
+def _compute_duration_short(total: int) -> str:
     hours, rem = divmod(total, 3600)
     minutes, secs = divmod(rem, 60)
     if hours:
@@ -82,7 +142,33 @@ def format_duration_short(seconds: int | None) -> str:
     return f"{minutes:02}:{secs:02}"
 
 
+FORMAT_TABLE_LIMIT = 3600
+_HMS_TABLE = tuple(_compute_hms(value) for value in range(FORMAT_TABLE_LIMIT + 1))
+_DURATION_SHORT_TABLE = tuple(_compute_duration_short(value) for value in range(FORMAT_TABLE_LIMIT + 1))
+
+
+def format_hms(total_seconds: int) -> str:
+    total_seconds = max(0, int(total_seconds))
+    if total_seconds <= FORMAT_TABLE_LIMIT:
+        return _HMS_TABLE[total_seconds]
+    return _compute_hms(total_seconds)
+
+
+def format_duration_short(seconds: int | None) -> str:
+    if not seconds:
+        return "00:00"
+    total = int(seconds)
+    if 0 <= total <= FORMAT_TABLE_LIMIT:
+        return _DURATION_SHORT_TABLE[total]
+    return _compute_duration_short(total)
+
+
+@lru_cache(maxsize=1024)
 def extract_video_id(url: str) -> str | None:
+    match = YOUTUBE_URL_PATTERN.match(url.strip())
+    if match:
+        return match.group(1) or match.group(2)
+
     try:
         parsed = urlparse(url.strip())
     except Exception:
@@ -109,7 +195,11 @@ def extract_video_id(url: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=1024)
 def is_valid_youtube_url(url: str) -> bool:
+    if YOUTUBE_URL_PATTERN.match(url.strip()):
+        return True
+
     try:
         parsed = urlparse(url.strip())
     except Exception:
@@ -128,6 +218,7 @@ def is_valid_youtube_url(url: str) -> bool:
     return extract_video_id(url) is not None
 
 
+@lru_cache(maxsize=1024)
 def canonical_watch_url(url: str) -> str:
     video_id = extract_video_id(url)
     if video_id:
@@ -136,37 +227,70 @@ def canonical_watch_url(url: str) -> str:
 
 
 def find_cached_audio(cache_dir: Path, video_id: str) -> Path | None:
-    for path in sorted(cache_dir.glob(f"{video_id}.*")):
-        if not path.is_file():
-            continue
-        if path.name.lower().endswith(PARTIAL_CACHE_SUFFIXES):
-            continue
-        return path.resolve()
+    prefix = f"{video_id}."
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(prefix):
+                    continue
+                if name.lower().endswith(PARTIAL_CACHE_SUFFIXES):
+                    continue
+                if entry.is_file(follow_symlinks=False):
+                    return Path(entry.path).resolve()
+    except OSError:
+        pass
     return None
 
 
 def cleanup_partial_cache_files(cache_dir: Path, video_id: str) -> None:
-    for path in cache_dir.glob(f"{video_id}.*"):
-        if not path.is_file():
-            continue
-        if not path.name.lower().endswith(PARTIAL_CACHE_SUFFIXES):
-            continue
-        try:
-            path.unlink(missing_ok=True)
-        except Exception:
-            pass
+    prefix = f"{video_id}."
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith(prefix):
+                    continue
+                if not name.lower().endswith(PARTIAL_CACHE_SUFFIXES):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
 
 
 def cleanup_all_partial_cache_files(cache_dir: Path) -> None:
-    for path in cache_dir.iterdir():
-        if not path.is_file():
-            continue
-        if not path.name.lower().endswith(PARTIAL_CACHE_SUFFIXES):
-            continue
-        try:
-            path.unlink(missing_ok=True)
-        except Exception:
-            pass
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(PARTIAL_CACHE_SUFFIXES):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
+
+
+def prefetch_file(path: Path) -> None:
+    try:
+        if hasattr(os, "posix_fadvise"):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+            return
+        with open(path, "rb", buffering=0) as handle:
+            while handle.read(1 << 20):
+                pass
+    except OSError:
+        pass
 
 
 @dataclass
@@ -176,6 +300,18 @@ class TimerSnapshot:
     total_seconds: int
     remaining_seconds: int
     is_running: bool
+    # Ticks are not persisted; a running timer is restored from this wall-clock deadline.
+    ends_at: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "timer_id": self.timer_id,
+            "title": self.title,
+            "total_seconds": self.total_seconds,
+            "remaining_seconds": self.remaining_seconds,
+            "is_running": self.is_running,
+            "ends_at": self.ends_at,
+        }
 
 
 @dataclass
@@ -186,6 +322,8 @@ class QueueEntry:
     duration: int
     video_id: str
     file_path: str
+    # Set in on_download_finished, which every queued entry passes through.
+    qurl: QUrl | None = field(default=None, repr=False, compare=False)
 
     def display_text(self) -> str:
         return f"{self.title}  [{format_duration_short(self.duration)}]"
@@ -197,45 +335,94 @@ class RingTimeDisplay(QWidget):
         self._progress = 0.0
         self._time_text = "00:00:00"
 
+        self._track_pen = QPen(QColor("#3b3d45"), 12)
+        self._track_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        self._progress_pen = QPen(QColor("#f27f62"), 12)
+        self._progress_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        self._text_color = QColor("#d6d7db")
+        self._font = QFont(self.font())
+        self._font.setPointSize(20)
+        self._font.setBold(True)
+        self._font_metrics = QFontMetrics(self._font)
+        self._track_pixmap: QPixmap | None = None
+
     def sizeHint(self) -> QSize:
         return QSize(220, 220)
 
+    def _ring_rect(self) -> QRect:
+        padding = 14
+        return self.rect().adjusted(padding, padding, -padding, -padding)
+
+    def _text_rect(self, text: str) -> QRect:
+        width = self._font_metrics.horizontalAdvance(text) + 4
+        height = self._font_metrics.height() + 4
+        rect = QRect(0, 0, width, height)
+        rect.moveCenter(self.rect().center())
+        return rect
+
+    @staticmethod
+    def _span_angle(progress: float) -> int:
+        return -int(progress * 360 * 16)
+
+    def _rebuild_track_pixmap(self) -> None:
+        if self.width() <= 0 or self.height() <= 0:
+            self._track_pixmap = None
+            return
+
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(self._track_pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(self._ring_rect())
+        painter.end()
+        self._track_pixmap = pixmap
+
+    def resizeEvent(self, event: Any) -> None:  # noqa: N802
+        super().resizeEvent(event)
+        self._rebuild_track_pixmap()
+
     def set_state(self, time_text: str, progress: float) -> None:
+        progress = max(0.0, min(1.0, progress))
+        if time_text == self._time_text and abs(progress - self._progress) < 1 / 360:
+            return
+
+        arc_changed = self._span_angle(progress) != self._span_angle(self._progress)
+        old_text_rect = self._text_rect(self._time_text)
         self._time_text = time_text
-        self._progress = max(0.0, min(1.0, progress))
-        self.update()
+        self._progress = progress
+        if arc_changed:
+            self.update(self._ring_rect().adjusted(-7, -7, 7, 7))
+        else:
+            self.update(old_text_rect.united(self._text_rect(time_text)))
+
+    def paintEvent(self, event: Any) -> None:
+        if self._track_pixmap is None or self._track_pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self._rebuild_track_pixmap()
 
-    def paintEvent(self, _event: Any) -> None:
         painter = QPainter(self)
+        if self._track_pixmap is not None:
+            painter.drawPixmap(0, 0, self._track_pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
-        padding = 14
-        rect = self.rect().adjusted(padding, padding, -padding, -padding)
-
-        track_pen = QPen(QColor("#3b3d45"), 12)
-        track_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(track_pen)
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawEllipse(rect)
-
-        if self._progress > 0.0:
-            progress_pen = QPen(QColor("#f27f62"), 12)
-            progress_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            painter.setPen(progress_pen)
+        text_only = self._text_rect(self._time_text).contains(event.rect())
+        if self._progress > 0.0 and not text_only:
+            painter.setPen(self._progress_pen)
             start_angle = 90 * 16
-            span_angle = -int(self._progress * 360 * 16)
-            painter.drawArc(rect, start_angle, span_angle)
-
-        painter.setPen(QColor("#d6d7db"))
-        font = painter.font()
-        font.setPointSize(20)
-        font.setBold(True)
-        painter.setFont(font)
+            painter.drawArc(self._ring_rect(), start_angle, self._span_angle(self._progress))
+
+        painter.setPen(self._text_color)
+        painter.setFont(self._font)
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._time_text)
 
 
 class TimerCard(QFrame):
     changed = Signal()
+    running_changed = Signal(str)
     delete_requested = Signal(str)
 
     def __init__(self, snapshot: TimerSnapshot, parent: QWidget | None = None) -> None:
@@ -245,7 +432,10 @@ class TimerCard(QFrame):
         self.title = snapshot.title
         self.total_seconds = max(1, int(snapshot.total_seconds))
         self.remaining_seconds = max(0, int(snapshot.remaining_seconds))
-        self.is_running = bool(snapshot.is_running)
+        self.is_running = False
+        self._end_monotonic = 0.0
+        self._ends_at = 0.0
+        self._visual_stale = False
 
         self.setObjectName("TimerCard")
         self.setMinimumSize(320, 320)
@@ -276,6 +466,7 @@ class TimerCard(QFrame):
         controls.addStretch(1)
 
         self.play_pause_button = QPushButton("Play")
+        self.play_pause_button.setObjectName("PrimaryCTA")
         self.play_pause_button.setFixedHeight(34)
         self.play_pause_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.play_pause_button.clicked.connect(self.toggle_start_pause)
@@ -311,13 +502,9 @@ class TimerCard(QFrame):
         set_row.addWidget(self.set_button)
         outer.addLayout(set_row)
 
-        self.timer = QTimer(self)
-        self.timer.setInterval(1000)
-        self.timer.timeout.connect(self.on_tick)
-
         self.sync_inputs_from_total()
         self.update_visual_state()
-        self.set_running(self.is_running and self.remaining_seconds > 0)
+        self.set_running(bool(snapshot.is_running) and self.remaining_seconds > 0, ends_at=snapshot.ends_at)
 
     def sync_inputs_from_total(self) -> None:
         h, rem = divmod(self.total_seconds, 3600)
@@ -326,13 +513,23 @@ class TimerCard(QFrame):
         self.minutes_spin.setValue(m)
         self.seconds_spin.setValue(s)
 
-    def set_running(self, running: bool) -> None:
+    def set_running(self, running: bool, ends_at: float | None = None) -> None:
+        was_running = self.is_running
         self.is_running = bool(running and self.remaining_seconds > 0)
-        if self.is_running:
-            self.timer.start()
-        else:
-            self.timer.stop()
+        if self.is_running and not was_running:
+            if ends_at is not None:
+                # Rebuilding from the rounded-up remaining_seconds would drift on every restart.
+                self._ends_at = ends_at
+                self._end_monotonic = time.monotonic() + (ends_at - time.time())
+            else:
+                self._end_monotonic = time.monotonic() + self.remaining_seconds
+                self._ends_at = time.time() + self.remaining_seconds
         self.play_pause_button.setText("Pause" if self.is_running else "Play")
+        if self.is_running != was_running:
+            self.running_changed.emit(self.timer_id)
+
+    def remaining_from_clock(self) -> int:
+        return max(0, math.ceil(self._end_monotonic - time.monotonic()))
 
     def update_visual_state(self) -> None:
         progress = 1.0 - (self.remaining_seconds / self.total_seconds) if self.total_seconds > 0 else 0.0
@@ -351,6 +548,8 @@ class TimerCard(QFrame):
         self.changed.emit()
 
     def toggle_start_pause(self) -> None:
+        if self.is_running:
+            self.remaining_seconds = self.remaining_from_clock()
         if self.remaining_seconds <= 0:
             self.remaining_seconds = self.total_seconds
         self.set_running(not self.is_running)
@@ -364,19 +563,29 @@ class TimerCard(QFrame):
         self.changed.emit()
 
     def on_tick(self) -> None:
-        if self.remaining_seconds <= 0:
-            self.remaining_seconds = 0
-            self.set_running(False)
-            self.update_visual_state()
-            self.changed.emit()
+        remaining = self.remaining_from_clock()
+        if remaining == self.remaining_seconds:
             return
 
-        self.remaining_seconds -= 1
+        self.remaining_seconds = remaining
         if self.remaining_seconds <= 0:
-            self.remaining_seconds = 0
             self.set_running(False)
-        self.update_visual_state()
-        self.changed.emit()
+            self.changed.emit()
+        if self.ring.visibleRegion().isEmpty():
+            self._visual_stale = True
+        else:
+            self.update_visual_state()
+
+    def refresh_if_stale(self) -> None:
+        if self._visual_stale and not self.ring.visibleRegion().isEmpty():
+            self._visual_stale = False
+            self.update_visual_state()
+
+    def showEvent(self, event: Any) -> None:  # noqa: N802
+        super().showEvent(event)
+        if self._visual_stale:
+            self._visual_stale = False
+            self.update_visual_state()
 
     def snapshot(self) -> TimerSnapshot:
         return TimerSnapshot(
@@ -385,18 +594,50 @@ class TimerCard(QFrame):
             total_seconds=int(self.total_seconds),
             remaining_seconds=int(self.remaining_seconds),
             is_running=bool(self.is_running),
+            ends_at=self._ends_at if self.is_running else None,
         )
 
 
-class YtDownloadWorker(QObject):
+class YtDownloadSignals(QObject):
     progress = Signal(str)
     finished = Signal(object)
     error = Signal(str)
+    metadata = Signal(str, str, int)
+
+
+class YtMetadataRunnable(QRunnable):
+    """Fetch title/duration for an entry that was queued straight from the cache."""
 
-    def __init__(self, url: str, cache_dir: Path) -> None:
+    def __init__(self, queue_id: str, url: str, signals: YtDownloadSignals) -> None:
+        super().__init__()
+        self.queue_id = queue_id
+        self.url = url
+        self.metadata = signals.metadata
+
+    def run(self) -> None:
+        if yt_dlp is None:
+            return
+
+        try:
+            with borrowed_youtube_dl(("info",), YDL_INFO_OPTS) as ydl:
+                info = ydl.extract_info(self.url, download=False)
+        except Exception:
+            return
+
+        if isinstance(info, dict):
+            title = str(info.get("title") or "Untitled")
+            duration = int(info.get("duration") or 0)
+            self.metadata.emit(self.queue_id, title, duration)
+
+
+class YtDownloadRunnable(QRunnable):
+    def __init__(self, url: str, cache_dir: Path, signals: YtDownloadSignals) -> None:
         super().__init__()
         self.url = url
         self.cache_dir = cache_dir
+        self.progress = signals.progress
+        self.finished = signals.finished
+        self.error = signals.error
 
     def run(self) -> None:
         if yt_dlp is None:
@@ -411,13 +652,7 @@ class YtDownloadWorker(QObject):
                 return
 
             self.progress.emit("Fetching metadata...")
-            info_opts = {
-                "quiet": True,
-                "no_warnings": True,
-                "noplaylist": True,
-                "skip_download": True,
-            }
-            with yt_dlp.YoutubeDL(info_opts) as ydl:
+            with borrowed_youtube_dl(("info",), YDL_INFO_OPTS) as ydl:
                 info = ydl.extract_info(canonical_url, download=False)
 
             if not isinstance(info, dict):
@@ -453,7 +688,8 @@ class YtDownloadWorker(QObject):
                 "nopart": True,
                 "retries": 3,
             }
-            with yt_dlp.YoutubeDL(dl_opts) as ydl:
+            with borrowed_youtube_dl(("download", str(self.cache_dir)), dl_opts) as ydl:
+                ydl.params["outtmpl"] = {"default": outtmpl}
                 downloaded_info = ydl.extract_info(canonical_url, download=True)
                 downloaded_path = Path(ydl.prepare_filename(downloaded_info)).resolve()
 
@@ -477,6 +713,48 @@ class YtDownloadWorker(QObject):
         except Exception as exc:
             self.error.emit(str(exc))
 
+
+class LayoutWriter(QThread):
+    failed = Signal(str)
+
+    def __init__(self, layout_path: Path, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.layout_path = layout_path
+        self._pending: queue.Queue[bytes | None] = queue.Queue(maxsize=1)
+
+    def submit(self, data: bytes) -> None:
+        if not self.isRunning():
+            self._write(data)
+            return
+        # At most one payload is pending; only the newest layout is worth writing.
+        try:
+            self._pending.get_nowait()
+        except queue.Empty:
+            pass
+        self._pending.put_nowait(data)
+
+    def stop(self) -> None:
+        if not self.isRunning():
+            return
+        self._pending.put(None)
+        self.wait()
+
+    def run(self) -> None:
+        while True:
+            data = self._pending.get()
+            if data is None:
+                return
+            self._write(data)
+
+    def _write(self, data: bytes) -> None:
+        try:
+            tmp_path = self.layout_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, self.layout_path)
+        except Exception as exc:
+            self.failed.emit(str(exc))
+
+
 class MainWindow(QMainWindow):
     def __init__(self) -> None:
         super().__init__()
@@ -487,33 +765,81 @@ class MainWindow(QMainWindow):
         self.layout_path = self.base_dir / "layout.json"
         self.cache_dir = self.base_dir / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        cleanup_all_partial_cache_files(self.cache_dir)
+        cache_dir = self.cache_dir
+        QThreadPool.globalInstance().start(lambda: cleanup_all_partial_cache_files(cache_dir))
 
         self.cards: dict[str, TimerCard] = {}
         self.card_order: list[str] = []
-
-        self.active_workers: list[YtDownloadWorker] = []
-        self.active_threads: list[QThread] = []
+        self._last_cols = 0
+        self._last_stretch_row = 0
+        self._cards_dirty = False
+
+        self._relayout_timer = QTimer(self)
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(0)
+        self._relayout_timer.timeout.connect(self._do_relayout_cards)
+
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._do_relayout_cards)
+        self._resize_timer.timeout.connect(self._refresh_stale_cards)
+
+        # yt-dlp jobs block on the network; keep them off the global pool.
+        self.yt_pool = QThreadPool(self)
+        self.yt_pool.setMaxThreadCount(2)
+        self.yt_signals = YtDownloadSignals(self)
+        self.yt_signals.progress.connect(self._set_music_status)
+        self.yt_signals.finished.connect(self.on_download_finished)
+        self.yt_signals.error.connect(self.on_download_error)
+        self.yt_signals.metadata.connect(self.on_metadata_refreshed)
 
         self.media_player: QMediaPlayer | None = None
+        # Standby player used to open the next track before the current one ends.
+        self.idle_player: QMediaPlayer | None = None
+        self.primed_queue_id: str | None = None
+        self._current_source_queue_id: str | None = None
         self.audio_output: QAudioOutput | None = None
         self.current_queue_id: str | None = None
+        self._item_by_queue_id: dict[str, QListWidgetItem] = {}
+        self.prefetched_queue_id: str | None = None
         self.is_user_seeking = False
-
+        self._last_progress_label_key: tuple[int, int] | None = None
+        self._last_slider_value = -1
+
+        self._last_snapshots: list[TimerSnapshot] | None = None
+        self.layout_writer = LayoutWriter(self.layout_path, self)
+        self.layout_writer.failed.connect(self.on_layout_save_failed)
+        self.layout_writer.start()
+        self._dirty = False
         self.save_timer = QTimer(self)
-        self.save_timer.setInterval(250)
+        self.save_timer.setInterval(2000)
         self.save_timer.setSingleShot(True)
-        self.save_timer.timeout.connect(self.save_layout)
+        self.save_timer.timeout.connect(self._save_if_dirty)
+
+        self._running_cards: set[TimerCard] = set()
+        self.master_tick = QTimer(self)
+        self.master_tick.setInterval(250)
+        self.master_tick.timeout.connect(self._tick_all)
+
+        self._pending_seek_value: int | None = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(60)
+        self._seek_timer.timeout.connect(self._apply_pending_seek)
 
         self.playback_timer = QTimer(self)
         self.playback_timer.setInterval(500)
         self.playback_timer.timeout.connect(self.update_playback_progress)
-        self.playback_timer.start()
 
         self._build_ui()
-        self._init_audio_player()
         self.load_layout()
 
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_layout)
+            app.focusChanged.connect(self._on_app_focus_changed)
+
     def _build_ui(self) -> None:
         root = QWidget()
         root_layout = QHBoxLayout(root)
@@ -580,6 +906,8 @@ class MainWindow(QMainWindow):
         self.cards_layout.setVerticalSpacing(14)
 
         self.scroll.setWidget(self.cards_container)
+        self.scroll.verticalScrollBar().valueChanged.connect(self._refresh_stale_cards)
+        self.scroll.horizontalScrollBar().valueChanged.connect(self._refresh_stale_cards)
         left_layout.addWidget(self.scroll)
 
         splitter.addWidget(left)
@@ -652,6 +980,7 @@ class MainWindow(QMainWindow):
         self.progress_slider.setRange(0, 1000)
         self.progress_slider.sliderPressed.connect(self.on_progress_slider_pressed)
         self.progress_slider.sliderReleased.connect(self.on_progress_slider_released)
+        self.progress_slider.valueChanged.connect(self.on_progress_slider_value_changed)
         progress_row.addWidget(self.progress_slider, 1)
         right_layout.addLayout(progress_row)
 
@@ -711,6 +1040,12 @@ class MainWindow(QMainWindow):
             QFrame#TimerCard QPushButton:hover {
                 background: #444852;
             }
+            QFrame#TimerCard QPushButton#PrimaryCTA {
+                background: #f27f62;
+                border: 1px solid #f27f62;
+                color: #101316;
+                border-radius: 8px;
+            }
             QWidget#MusicPanel {
                 background: #252830;
                 border: 1px solid #3a3e47;
@@ -719,14 +1054,9 @@ class MainWindow(QMainWindow):
             """
         )
 
-        for card in self.cards.values():
-            card.play_pause_button.setStyleSheet(
-                "background:#f27f62; border:1px solid #f27f62; color:#101316; border-radius:8px;"
-            )
-
     def resizeEvent(self, event: Any) -> None:  # noqa: N802
         super().resizeEvent(event)
-        self.relayout_cards()
+        self._resize_timer.start()
 
     # ----- Timer dashboard -----
     def add_custom_timer(self) -> None:
@@ -745,6 +1075,7 @@ class MainWindow(QMainWindow):
         timer_id: str | None = None,
         remaining_seconds: int | None = None,
         is_running: bool = False,
+        ends_at: float | None = None,
         save: bool = True,
     ) -> None:
         timer_id = timer_id or uuid.uuid4().hex
@@ -757,17 +1088,18 @@ class MainWindow(QMainWindow):
             total_seconds=max(1, int(total_seconds)),
             remaining_seconds=max(0, int(remaining_seconds if remaining_seconds is not None else total_seconds)),
             is_running=bool(is_running),
+            ends_at=ends_at,
         )
 
         card = TimerCard(snapshot)
         card.changed.connect(self.queue_save)
+        card.running_changed.connect(self._on_card_running_changed)
         card.delete_requested.connect(self.delete_timer_card)
-        card.play_pause_button.setStyleSheet(
-            "background:#f27f62; border:1px solid #f27f62; color:#101316; border-radius:8px;"
-        )
 
         self.cards[timer_id] = card
         self.card_order.append(timer_id)
+        self._cards_dirty = True
+        self._on_card_running_changed(timer_id)
 
         self.relayout_cards()
         if save:
@@ -783,20 +1115,47 @@ class MainWindow(QMainWindow):
 
         self.cards_layout.removeWidget(card)
         card.deleteLater()
+        self._cards_dirty = True
+        self._running_cards.discard(card)
+        self._sync_master_tick()
 
         self.relayout_cards()
         self.queue_save()
 
+    def _on_card_running_changed(self, timer_id: str) -> None:
+        card = self.cards.get(timer_id)
+        if card is None:
+            return
+        if card.is_running:
+            self._running_cards.add(card)
+        else:
+            self._running_cards.discard(card)
+        self._sync_master_tick()
+
+    def _sync_master_tick(self) -> None:
+        if self._running_cards:
+            if not self.master_tick.isActive():
+                self.master_tick.start()
+        else:
+            self.master_tick.stop()
+
+    def _tick_all(self) -> None:
+        # on_tick can stop a card, which removes it from the set, so iterate a copy.
+        for card in list(self._running_cards):
+            card.on_tick()
+
     def relayout_cards(self) -> None:
-        while self.cards_layout.count() > 0:
-            item = self.cards_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.setParent(self.cards_container)
+        self._relayout_timer.start()
 
+    def _do_relayout_cards(self) -> None:
         viewport_width = max(320, self.scroll.viewport().width())
         col_width = 340
         cols = max(1, viewport_width // col_width)
+        if cols == self._last_cols and not self._cards_dirty:
+            return
+
+        self.cards_layout.setColumnStretch(self._last_cols, 0)
+        self.cards_layout.setRowStretch(self._last_stretch_row, 0)
 
         row = 0
         col = 0
@@ -812,6 +1171,14 @@ class MainWindow(QMainWindow):
 
         self.cards_layout.setColumnStretch(cols, 1)
         self.cards_layout.setRowStretch(row + 1, 1)
+        self._last_cols = cols
+        self._cards_dirty = False
+        self._last_stretch_row = row + 1
+        self._refresh_stale_cards()
+
+    def _refresh_stale_cards(self) -> None:
+        for card in self.cards.values():
+            card.refresh_if_stale()
 
     # ----- YouTube audio -----
     def _set_music_status(self, message: str) -> None:
@@ -834,7 +1201,9 @@ class MainWindow(QMainWindow):
             control.setEnabled(enabled)
 
     def _init_audio_player(self) -> None:
-        if QMediaPlayer is None or QAudioOutput is None:
+        if self.media_player is not None:
+            return
+        if not load_qt_multimedia():
             self._set_music_controls_enabled(False)
             self._set_music_status("Audio backend unavailable in this PySide6 build.")
             return
@@ -842,22 +1211,86 @@ class MainWindow(QMainWindow):
         self.audio_output = QAudioOutput(self)
         self.audio_output.setVolume(self.volume_slider.value() / 100.0)
 
-        self.media_player = QMediaPlayer(self)
+        for _ in range(2):
+            player = QMediaPlayer(self)
+            player.mediaStatusChanged.connect(self._on_media_status_changed)
+            player.playbackStateChanged.connect(self._on_playback_state_changed)
+            player.errorOccurred.connect(self._on_media_error)
+            if self.media_player is None:
+                self.media_player = player
+            else:
+                self.idle_player = player
         self.media_player.setAudioOutput(self.audio_output)
-        self.media_player.mediaStatusChanged.connect(self._on_media_status_changed)
-        self.media_player.errorOccurred.connect(self._on_media_error)
 
         self._set_music_status("Ready.")
 
+    def _from_active_player(self) -> bool:
+        # Both players share these slots; ignore whatever the standby player reports.
+        return self.sender() is self.media_player
+
+    def _swap_to_idle_player(self) -> None:
+        previous = self.media_player
+        self.media_player = self.idle_player
+        self.idle_player = previous
+        self._current_source_queue_id = self.primed_queue_id
+        self.primed_queue_id = None
+
+        previous.setAudioOutput(None)
+        previous.stop()
+        self.media_player.setAudioOutput(self.audio_output)
+
+    def prime_next_entry(self) -> None:
+        if self.idle_player is None:
+            return
+        entry = self.next_queue_entry()
+        if entry is None or entry.queue_id == self.primed_queue_id:
+            return
+
+        self.primed_queue_id = entry.queue_id
+        self.idle_player.setSource(entry.qurl)
+
+    def _on_playback_state_changed(self, state: Any) -> None:
+        if not self._from_active_player():
+            return
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self.playback_timer.start()
+        else:
+            self.playback_timer.stop()
+            if state == QMediaPlayer.PlaybackState.PausedState:
+                self.update_playback_progress()
+
     def _on_media_error(self, _error: Any, error_string: str) -> None:
+        if not self._from_active_player():
+            if self.sender() is self.idle_player:
+                self.primed_queue_id = None
+            return
         if error_string:
             self._set_music_status(f"Playback error: {error_string}")
 
     def _on_media_status_changed(self, status: Any) -> None:
-        if QMediaPlayer is None:
+        if QMediaPlayer is None or not self._from_active_player():
             return
         if status == QMediaPlayer.MediaStatus.EndOfMedia:
             self.play_next(auto_triggered=True)
+        elif status == QMediaPlayer.MediaStatus.BufferedMedia:
+            self.prefetch_next_entry()
+
+    def next_queue_entry(self) -> QueueEntry | None:
+        next_row = self.find_current_row() + 1
+        if next_row <= 0 or next_row >= self.stack_list.count():
+            return None
+
+        entry = self.stack_list.item(next_row).data(Qt.ItemDataRole.UserRole)
+        return entry if isinstance(entry, QueueEntry) else None
+
+    def prefetch_next_entry(self) -> None:
+        entry = self.next_queue_entry()
+        if entry is None or entry.queue_id == self.prefetched_queue_id:
+            return
+
+        self.prefetched_queue_id = entry.queue_id
+        file_path = Path(entry.file_path)
+        QThreadPool.globalInstance().start(lambda: prefetch_file(file_path))
 
     def handle_add_url(self) -> None:
         if yt_dlp is None:
@@ -872,43 +1305,52 @@ class MainWindow(QMainWindow):
             self._set_music_status("Invalid YouTube URL.")
             return
 
-        worker = YtDownloadWorker(url=url, cache_dir=self.cache_dir)
-        thread = QThread(self)
-        worker.moveToThread(thread)
-
-        worker.progress.connect(self._set_music_status)
-        worker.finished.connect(self.on_download_finished)
-        worker.error.connect(self.on_download_error)
-        worker.finished.connect(thread.quit)
-        worker.error.connect(thread.quit)
-        thread.started.connect(worker.run)
-        worker.finished.connect(worker.deleteLater)
-        worker.error.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-        thread.finished.connect(lambda: self._cleanup_worker_thread(worker, thread))
-
-        self.active_workers.append(worker)
-        self.active_threads.append(thread)
+        video_id = extract_video_id(url)
+        cached = find_cached_audio(self.cache_dir, video_id) if video_id else None
+        if video_id and cached:
+            # Queue immediately from the cache; title/duration are filled in later.
+            entry = QueueEntry(
+                queue_id=uuid.uuid4().hex,
+                url=canonical_watch_url(url),
+                title=cached.stem,
+                duration=0,
+                video_id=video_id,
+                file_path=str(cached),
+            )
+            self.on_download_finished(entry)
+            self.yt_pool.start(YtMetadataRunnable(entry.queue_id, entry.url, self.yt_signals))
+            return
 
         self._set_music_status("Fetching metadata/download...")
-        thread.start()
-
-    def _cleanup_worker_thread(self, worker: YtDownloadWorker, thread: QThread) -> None:
-        if worker in self.active_workers:
-            self.active_workers.remove(worker)
-        if thread in self.active_threads:
-            self.active_threads.remove(thread)
+        self.yt_pool.start(YtDownloadRunnable(url, self.cache_dir, self.yt_signals))
 
     def on_download_finished(self, entry: QueueEntry) -> None:
+        entry.qurl = QUrl.fromLocalFile(entry.file_path)
         item = QListWidgetItem(entry.display_text())
         item.setData(Qt.ItemDataRole.UserRole, entry)
         self.stack_list.addItem(item)
+        self._item_by_queue_id[entry.queue_id] = item
         self.url_input.clear()
         self._set_music_status(f"Added: {entry.title}")
 
         if self.stack_list.count() == 1:
             self.stack_list.setCurrentRow(0)
 
+    def on_metadata_refreshed(self, queue_id: str, title: str, duration: int) -> None:
+        item = self._item_by_queue_id.get(queue_id)
+        if item is None:
+            return
+        entry = item.data(Qt.ItemDataRole.UserRole)
+        if not isinstance(entry, QueueEntry):
+            return
+
+        entry.title = title
+        entry.duration = duration
+        item.setData(Qt.ItemDataRole.UserRole, entry)
+        item.setText(entry.display_text())
+        if queue_id == self.current_queue_id:
+            self.now_playing_label.setText(f"Now playing: {entry.title}")
+
     def on_download_error(self, message: str) -> None:
         self._set_music_status(f"Error: {message}")
 
@@ -920,10 +1362,10 @@ class MainWindow(QMainWindow):
 
     def find_current_row(self) -> int:
         if self.current_queue_id:
-            for row in range(self.stack_list.count()):
-                item = self.stack_list.item(row)
-                entry = item.data(Qt.ItemDataRole.UserRole)
-                if isinstance(entry, QueueEntry) and entry.queue_id == self.current_queue_id:
+            item = self._item_by_queue_id.get(self.current_queue_id)
+            if item is not None:
+                row = self.stack_list.row(item)
+                if row >= 0:
                     return row
         return self.selected_or_first_row()
 
@@ -931,8 +1373,8 @@ class MainWindow(QMainWindow):
         self.play_row(self.selected_or_first_row())
 
     def play_row(self, row: int) -> None:
+        self._init_audio_player()
         if self.media_player is None:
-            self._set_music_status("Audio player unavailable.")
             return
         if row < 0 or row >= self.stack_list.count():
             self._set_music_status("Select an item to play.")
@@ -949,7 +1391,17 @@ class MainWindow(QMainWindow):
             self._set_music_status("Cached file missing. Remove and add URL again.")
             return
 
-        self.media_player.setSource(QUrl.fromLocalFile(str(file_path)))
+        resuming = (
+            entry.queue_id == self._current_source_queue_id
+            and self.media_player.playbackState() == QMediaPlayer.PlaybackState.PausedState
+        )
+        if not resuming:
+            if entry.queue_id == self.primed_queue_id:
+                # The standby player already opened this file; just hand it the output.
+                self._swap_to_idle_player()
+            else:
+                self.media_player.setSource(entry.qurl)
+                self._current_source_queue_id = entry.queue_id
         self.media_player.play()
 
         self.current_queue_id = entry.queue_id
@@ -959,8 +1411,8 @@ class MainWindow(QMainWindow):
         self._set_music_status(f"Playing: {entry.title}")
 
     def toggle_play_pause(self) -> None:
-        if self.media_player is None or QMediaPlayer is None:
-            self._set_music_status("Audio player unavailable.")
+        self._init_audio_player()
+        if self.media_player is None:
             return
 
         state = self.media_player.playbackState()
@@ -980,8 +1432,12 @@ class MainWindow(QMainWindow):
             return
         self.media_player.stop()
         self.play_pause_button.setText("Play")
+        self.progress_slider.blockSignals(True)
         self.progress_slider.setValue(0)
+        self.progress_slider.blockSignals(False)
         self.progress_label.setText("00:00 / 00:00")
+        self._last_slider_value = 0
+        self._last_progress_label_key = None
         self.now_playing_label.setText("Now playing: (none)")
         self.current_queue_id = None
         self._set_music_status("Stopped.")
@@ -1017,8 +1473,10 @@ class MainWindow(QMainWindow):
         item = self.stack_list.item(row)
         entry = item.data(Qt.ItemDataRole.UserRole)
         was_current = isinstance(entry, QueueEntry) and entry.queue_id == self.current_queue_id
+        if isinstance(entry, QueueEntry):
+            self._item_by_queue_id.pop(entry.queue_id, None)
 
-        self.stack_list.takeItem(row)
+        self.stack_list.model().removeRow(row)
         if was_current:
             self.stop_playback()
         self._set_music_status("Removed item.")
@@ -1033,8 +1491,12 @@ class MainWindow(QMainWindow):
         if new_row < 0 or new_row >= self.stack_list.count():
             return
 
-        item = self.stack_list.takeItem(row)
-        self.stack_list.insertItem(new_row, item)
+        # moveRow shifts the existing item in place; the destination is the row it
+        # should land in front of, counted before the move.
+        destination = new_row if direction < 0 else new_row + 1
+        if not self.stack_list.model().moveRow(QModelIndex(), row, QModelIndex(), destination):
+            item = self.stack_list.takeItem(row)
+            self.stack_list.insertItem(new_row, item)
         self.stack_list.setCurrentRow(new_row)
         self._set_music_status("Reordered queue.")
 
@@ -1047,13 +1509,26 @@ class MainWindow(QMainWindow):
 
     def on_progress_slider_released(self) -> None:
         self.is_user_seeking = False
-        if self.media_player is None:
+        self._last_slider_value = -1
+        self._pending_seek_value = self.progress_slider.value()
+        self._seek_timer.stop()
+        self._apply_pending_seek()
+
+    def on_progress_slider_value_changed(self, value: int) -> None:
+        self._pending_seek_value = value
+        self._seek_timer.start()
+
+    def _apply_pending_seek(self) -> None:
+        value = self._pending_seek_value
+        self._pending_seek_value = None
+        if value is None or self.media_player is None:
             return
 
         duration = self.media_player.duration()
         if duration and duration > 0:
-            new_position = int((self.progress_slider.value() / 1000.0) * duration)
+            new_position = int((value / 1000.0) * duration)
             self.media_player.setPosition(new_position)
+        self.update_playback_progress()
 
     def update_playback_progress(self) -> None:
         if self.media_player is None:
@@ -1063,27 +1538,57 @@ class MainWindow(QMainWindow):
         position = self.media_player.position()
         if duration and duration > 0 and position >= 0:
             if not self.is_user_seeking:
-                value = int((position / duration) * 1000)
-                self.progress_slider.blockSignals(True)
-                self.progress_slider.setValue(max(0, min(1000, value)))
-                self.progress_slider.blockSignals(False)
-
-            elapsed = format_duration_short(int(position / 1000))
-            total = format_duration_short(int(duration / 1000))
-            self.progress_label.setText(f"{elapsed} / {total}")
+                value = max(0, min(1000, int((position / duration) * 1000)))
+                if value != self._last_slider_value:
+                    self._last_slider_value = value
+                    self.progress_slider.blockSignals(True)
+                    self.progress_slider.setValue(value)
+                    self.progress_slider.blockSignals(False)
+
+            label_key = (int(position / 1000), int(duration / 1000))
+            if label_key != self._last_progress_label_key:
+                self._last_progress_label_key = label_key
+                elapsed = format_duration_short(label_key[0])
+                total = format_duration_short(label_key[1])
+                self.progress_label.setText(f"{elapsed} / {total}")
+
+            if duration - position <= 5000:
+                self.prime_next_entry()
 
     # ----- Persistence -----
     def queue_save(self) -> None:
-        self.save_timer.start()
+        self._dirty = True
+        if not self.save_timer.isActive():
+            self.save_timer.start()
+
+    def _save_if_dirty(self) -> None:
+        if self._dirty:
+            self._save_layout_to_disk()
+
+    def _on_app_focus_changed(self, _old: QWidget | None, new: QWidget | None) -> None:
+        if new is None:
+            self._save_if_dirty()
+
+    def _save_layout_to_disk(self) -> None:
+        self._dirty = False
+        self.save_timer.stop()
+        snapshots = [self.cards[timer_id].snapshot() for timer_id in self.card_order if timer_id in self.cards]
+        if snapshots == self._last_snapshots:
+            return
 
-    def save_layout(self) -> None:
-        payload = {
-            "timers": [asdict(self.cards[timer_id].snapshot()) for timer_id in self.card_order if timer_id in self.cards],
-        }
-        try:
-            self.layout_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        except Exception as exc:
-            QMessageBox.warning(self, "Save Error", f"Could not save layout.json\n\n{exc}")
+        payload = {"timers": [snapshot.to_dict() for snapshot in snapshots]}
+        data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        self._last_snapshots = snapshots
+        self.layout_writer.submit(data)
+
+    def flush_layout(self) -> None:
+        self._save_layout_to_disk()
+        self.layout_writer.stop()
+
+    def on_layout_save_failed(self, message: str) -> None:
+        # Force the next save to retry instead of matching the failed snapshots.
+        self._last_snapshots = None
+        QMessageBox.warning(self, "Save Error", f"Could not save layout.json\n\n{message}")
 
     def load_layout(self) -> None:
         data: dict[str, Any] = {}
@@ -1107,12 +1612,19 @@ class MainWindow(QMainWindow):
                 total = int(item.get("total_seconds") or 60)
                 remaining = int(item.get("remaining_seconds") or total)
                 is_running = bool(item.get("is_running", False))
+                ends_at = item.get("ends_at")
+                if is_running and isinstance(ends_at, (int, float)):
+                    ends_at = float(ends_at)
+                    remaining = max(0, math.ceil(ends_at - time.time()))
+                else:
+                    ends_at = None
                 self.add_timer_card(
                     title=title,
                     total_seconds=total,
                     timer_id=timer_id,
                     remaining_seconds=remaining,
                     is_running=is_running,
+                    ends_at=ends_at,
                     save=False,
                 )
                 loaded = True
@@ -1124,13 +1636,16 @@ class MainWindow(QMainWindow):
         self.add_timer_card("1 min", 60, save=False)
         self.add_timer_card("3 min", 180, save=False)
         self.add_timer_card("1 hour", 3600, save=False)
-        self.save_layout()
+        self._save_layout_to_disk()
 
     def closeEvent(self, event: Any) -> None:  # noqa: N802
         try:
-            self.save_layout()
+            self.flush_layout()
             if self.media_player is not None:
                 self.media_player.stop()
+            if self.idle_player is not None:
+                self.idle_player.stop()
+            close_youtube_dl_instances()
         except Exception:
             pass
         super().closeEvent(event)
@@ -1145,12 +1660,6 @@ def maybe_rebuild_executable() -> None:
         sys.argv[:] = [arg for arg in sys.argv if arg != "--skip-build"]
         return
 
-    try:
-        import PyInstaller.__main__  # type: ignore # noqa: F401
-    except Exception:
-        print("PyInstaller is not installed. Run: uv add pyinstaller")
-        return
-
     base_dir = Path(__file__).resolve().parent
     script_path = base_dir / "main.py"
     dist_dir = base_dir / "dist"
@@ -1159,6 +1668,24 @@ def maybe_rebuild_executable() -> None:
     exe_name = f"{EXE_BASE_NAME}.exe" if os.name == "nt" else EXE_BASE_NAME
     exe_path = dist_dir / exe_name
 
+    try:
+        src_mtime = script_path.stat().st_mtime_ns
+        exe_mtime = exe_path.stat().st_mtime_ns
+    except OSError:
+        exe_mtime = src_mtime = 0
+    if exe_mtime and exe_mtime >= src_mtime:
+        print(f"Executable up to date: {exe_path}")
+        return
+
+    try:
+        import PyInstaller.__main__  # type: ignore # noqa: F401
+    except Exception:
+        print("PyInstaller is not installed. Run: uv add pyinstaller")
+        return
+
+    import shutil
+    import subprocess
+
     dist_dir.mkdir(parents=True, exist_ok=True)
 
     if exe_path.exists():